@@ -57,15 +57,19 @@ class FrontendSpec(pydantic.BaseModel):
     feature_flags: FeatureFlags
     default_function_priority_class_name: typing.Optional[str]
     valid_function_priority_class_names: list[str] = []
-    default_function_image_by_kind: dict[str, str] = {}
+    default_function_image_by_kind: dict[str, str] = pydantic.Field(
+        default_factory=dict
+    )
     function_deployment_target_image_template: typing.Optional[str]
     function_deployment_target_image_name_prefix_template: str
     function_deployment_target_image_registries_to_enforce_prefix: list[str] = []
     function_deployment_mlrun_requirement: typing.Optional[str]
     auto_mount_type: typing.Optional[str]
-    auto_mount_params: dict[str, str] = {}
+    auto_mount_params: dict[str, str] = pydantic.Field(default_factory=dict)
     default_artifact_path: str
-    default_function_pod_resources: Resources = Resources()
+    default_function_pod_resources: Resources = pydantic.Field(
+        default_factory=Resources
+    )
     default_function_preemption_mode: str
     feature_store_data_prefixes: typing.Optional[dict[str, str]]
     allowed_artifact_path_prefixes_list: list[str]
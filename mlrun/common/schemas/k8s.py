@@ -26,8 +26,8 @@ class ResourceSpec(pydantic.BaseModel):
 
 
 class Resources(pydantic.BaseModel):
-    requests: ResourceSpec = ResourceSpec()
-    limits: ResourceSpec = ResourceSpec()
+    requests: ResourceSpec = pydantic.Field(default_factory=ResourceSpec)
+    limits: ResourceSpec = pydantic.Field(default_factory=ResourceSpec)
 
 
 class NodeSelectorOperator(mlrun.common.types.StrEnum):
@@ -36,6 +36,7 @@ from .constants import (
     PrometheusMetric,
     ResultData,
     ResultKindApp,
+    ResultStatusApp,
     SchedulingKeys,
     SpecialApps,
     TDEngineSuperTables,
@@ -65,6 +66,7 @@ from .model_endpoints import (
     ModelEndpointMonitoringMetricType,
     ModelEndpointMonitoringMetricValues,
     ModelEndpointMonitoringResultValues,
+    ModelEndpointMonitoringValues,
     ModelEndpointSpec,
     ModelEndpointStatus,
 )
@@ -16,7 +16,7 @@ import enum
 import json
 import re
 from datetime import datetime
-from typing import Any, NamedTuple, Optional
+from typing import Annotated, Any, Literal, NamedTuple, Optional, Union
 
 from pydantic import BaseModel, Field, validator
 from pydantic.main import Extra
@@ -346,12 +346,14 @@ class _ModelEndpointMonitoringMetricValuesBase(BaseModel):
 
 
 class ModelEndpointMonitoringMetricValues(_ModelEndpointMonitoringMetricValuesBase):
+    kind: Literal["metric"] = "metric"
     type: ModelEndpointMonitoringMetricType = ModelEndpointMonitoringMetricType.METRIC
     values: list[_MetricPoint]
     data: bool = True
 
 
 class ModelEndpointMonitoringResultValues(_ModelEndpointMonitoringMetricValuesBase):
+    kind: Literal["result"] = "result"
     type: ModelEndpointMonitoringMetricType = ModelEndpointMonitoringMetricType.RESULT
     result_kind: ResultKindApp
     values: list[_ResultPoint]
@@ -359,11 +361,23 @@ class ModelEndpointMonitoringResultValues(_ModelEndpointMonitoringMetricValuesBa
 
 
 class ModelEndpointMonitoringMetricNoData(_ModelEndpointMonitoringMetricValuesBase):
+    kind: Literal["nodata"] = "nodata"
     full_name: str
     type: ModelEndpointMonitoringMetricType
     data: bool = False
 
 
+# Tagged by `kind`, so that validation goes directly to the matching model instead of trying each of them
+ModelEndpointMonitoringValues = Annotated[
+    Union[
+        ModelEndpointMonitoringMetricValues,
+        ModelEndpointMonitoringResultValues,
+        ModelEndpointMonitoringMetricNoData,
+    ],
+    Field(discriminator="kind"),
+]
+
+
 def _mapping_attributes(
     base_model: BaseModel,
     flattened_dictionary: dict,
@@ -14,11 +14,12 @@
 
 import typing
 from abc import ABC, abstractmethod
-from datetime import datetime
+from datetime import datetime, timedelta
 
 import pandas as pd
 
 import mlrun.common.schemas.model_monitoring as mm_schemas
+import mlrun.errors
 import mlrun.model_monitoring.db.tsdb.helpers
 import mlrun.model_monitoring.helpers
 from mlrun.utils import logger
@@ -70,6 +71,20 @@ class TSDBConnector(ABC):
         :raise mlrun.errors.MLRunRuntimeError: If an error occurred while writing the event.
         """
 
+    def batch_write_application_events(
+        self,
+        events: list[dict],
+        kind: mm_schemas.WriterEventKind = mm_schemas.WriterEventKind.RESULT,
+    ) -> None:
+        """
+        Write multiple applications results or metrics of the same kind to TSDB. By default, the events are
+        written one by one. Connectors should override this method to write all the events in a single request.
+
+        :raise mlrun.errors.MLRunRuntimeError: If an error occurred while writing the events.
+        """
+        for event in events:
+            self.write_application_event(event=event, kind=kind)
+
     @abstractmethod
     def delete_tsdb_resources(self):
         """
@@ -104,6 +119,42 @@ class TSDBConnector(ABC):
         """
         pass
 
+    @abstractmethod
+    def _get_records(
+        self,
+        table: str,
+        start: typing.Union[datetime, str],
+        end: typing.Union[datetime, str],
+        *,
+        columns: typing.Optional[list[str]] = None,
+        filter_query: typing.Optional[str] = None,
+        interval: typing.Optional[str] = None,
+        agg_funcs: typing.Optional[list[str]] = None,
+        sliding_window_step: typing.Optional[str] = None,
+    ) -> pd.DataFrame:
+        """
+        Getting records from the TSDB data collection. The time range, filter and aggregation must be translated
+        into a native TSDB query, so that the records are filtered and aggregated by the TSDB engine and not in
+        memory after fetching the raw records. Connectors may accept additional TSDB specific keyword arguments.
+
+        :param table:               The table to query.
+        :param start:               The start time of the records.
+        :param end:                 The end time of the records.
+        :param columns:             Columns to include in the result.
+        :param filter_query:        Optional filter expression as a string, in the syntax of the TSDB.
+        :param interval:            The interval to aggregate the data by. Note that if interval is provided,
+                                    `agg_funcs` must be provided as well. Provided as a string in the format of '1m',
+                                    '1h', etc.
+        :param agg_funcs:           The aggregation functions to apply on the columns. If `interval` is not provided,
+                                    TSDBs that support it apply the functions over the whole time range. Provided as
+                                    a list of strings in the format of ['sum', 'avg', 'count', ...].
+        :param sliding_window_step: The time step for which the time window moves forward. Note that if
+                                    `sliding_window_step` is provided, interval must be provided as well. Provided
+                                    as a string in the format of '1m', '1h', etc.
+
+        :return: DataFrame with the provided attributes from the data collection.
+        """
+
     @abstractmethod
     def create_tables(self) -> None:
         """
@@ -138,6 +189,8 @@ class TSDBConnector(ABC):
     ]:
         """
         Read metrics OR results from the TSDB and return as a list.
+        Implementations should convert the TSDB output to the schema types (e.g. `ResultKindApp`) and build the
+        returned schema objects with `construct()`, rather than validating them per row.
 
         :param endpoint_id: The model endpoint identifier.
         :param start:       The start time of the query.
@@ -147,6 +200,100 @@ class TSDBConnector(ABC):
         :return:            A list of result values or a list of metric values.
         """
 
+    def read_metrics_data_stream(
+        self,
+        *,
+        endpoint_id: str,
+        start: datetime,
+        end: datetime,
+        metrics: list[mm_schemas.ModelEndpointMonitoringMetric],
+        type: typing.Literal["metrics", "results"],
+        chunk_size: int = 100,
+        chunk_interval: timedelta = timedelta(days=1),
+    ) -> typing.Iterator[
+        typing.Union[
+            list[
+                typing.Union[
+                    mm_schemas.ModelEndpointMonitoringResultValues,
+                    mm_schemas.ModelEndpointMonitoringMetricNoData,
+                ],
+            ],
+            list[
+                typing.Union[
+                    mm_schemas.ModelEndpointMonitoringMetricValues,
+                    mm_schemas.ModelEndpointMonitoringMetricNoData,
+                ],
+            ],
+        ]
+    ]:
+        """
+        Read metrics OR results from the TSDB in chunks, and yield the values of each chunk once it is read.
+        The time range is split into windows of `chunk_interval`, and each window is read in chunks of
+        `chunk_size` metrics. Unlike `read_metrics_data`, only the values of a single chunk are held in memory
+        at a time, so a long time range does not have to be loaded at once.
+        Consecutive windows do not overlap - each window ends one millisecond before the next one starts,
+        which is the precision of the TSDB timestamps.
+        A metric with data in several windows is returned in several values objects, one per window. A metric is
+        returned in a "no data" object only if it has no data in the whole time range - these objects are yielded
+        in a last chunk, after all the windows are read. Chunks without values are not yielded.
+
+        :param endpoint_id:    The model endpoint identifier.
+        :param start:          The start time of the query.
+        :param end:            The end time of the query.
+        :param metrics:        The list of metrics to get the values for.
+        :param type:           "metrics" or "results" - the type of each item in metrics.
+        :param chunk_size:     The maximum number of metrics to read in a single query.
+        :param chunk_interval: The maximum time range to read in a single query.
+        :return:               An iterator of lists of result values or of metric values, ordered by time window
+                               and then by metrics chunk, followed by a list of the "no data" objects.
+        :raise:                MLRunInvalidArgumentError if `chunk_size` is not positive or `chunk_interval` is shorter
+                               than one millisecond.
+        """
+        if chunk_size <= 0:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                f"chunk_size must be a positive integer, got {chunk_size}"
+            )
+        if chunk_interval < timedelta(milliseconds=1):
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                f"chunk_interval must be at least one millisecond, got {chunk_interval}"
+            )
+        metrics_with_data: set[str] = set()
+        metrics_without_data: dict[
+            str, mm_schemas.ModelEndpointMonitoringMetricNoData
+        ] = {}
+        window_start = start
+        while window_start <= end:
+            window_end = min(
+                window_start + chunk_interval - timedelta(milliseconds=1), end
+            )
+            for i in range(0, len(metrics), chunk_size):
+                chunk_values = []
+                for values in self.read_metrics_data(
+                    endpoint_id=endpoint_id,
+                    start=window_start,
+                    end=window_end,
+                    metrics=metrics[i : i + chunk_size],
+                    type=type,
+                ):
+                    if isinstance(
+                        values, mm_schemas.ModelEndpointMonitoringMetricNoData
+                    ):
+                        metrics_without_data.setdefault(values.full_name, values)
+                    else:
+                        metrics_with_data.add(values.full_name)
+                        chunk_values.append(values)
+                if chunk_values:
+                    yield chunk_values
+            window_start = window_end + timedelta(milliseconds=1)
+
+        no_data_values = [
+            values
+            for full_name, values in metrics_without_data.items()
+            if full_name not in metrics_with_data
+        ]
+        if no_data_values:
+            yield no_data_values
+
     @abstractmethod
     def read_predictions(
         self,
@@ -164,6 +311,8 @@ class TSDBConnector(ABC):
         """
         Read the "invocations" metric for the provided model endpoint in the given time range,
         and return the metric values if any, otherwise signify with the "no data" object.
+        The invocations are aggregated by the TSDB engine, see `_get_records`. As in `read_metrics_data`, the
+        returned object should be built with `construct()`.
 
         :param endpoint_id:        The model endpoint identifier.
         :param start:              The start time of the query.
@@ -180,6 +329,26 @@ class TSDBConnector(ABC):
         :return:                   Metric values object or no data object.
         """
 
+    @abstractmethod
+    def read_latest_point(
+        self,
+        *,
+        endpoint_id: str,
+        metric: str = mm_schemas.EventFieldType.LATENCY,
+    ) -> typing.Optional[tuple[datetime, float]]:
+        """
+        Read the latest value of a predictions column for the provided model endpoint. Unlike `read_predictions`,
+        no time range is required and a single point is returned, which fits "current value" queries.
+        Note: TSDBs that cannot scan backwards only look for the latest record in a recent lookback window. The V3IO
+        connector reads the records of the last hour, so it returns `None` for a model endpoint without predictions
+        in that window even if older data exists.
+
+        :param endpoint_id: The model endpoint identifier.
+        :param metric:      The predictions column to read, e.g. `latency`.
+        :return:            A tuple of the timestamp and the value of the latest record, or `None` if there is
+                            no data for the model endpoint.
+        """
+
     @staticmethod
     def df_to_metrics_values(
         *,
@@ -224,21 +393,18 @@ class TSDBConnector(ABC):
                 type=mm_schemas.ModelEndpointMonitoringMetricType.METRIC,
             )
             metrics_values.append(
-                mm_schemas.ModelEndpointMonitoringMetricValues(
+                mm_schemas.ModelEndpointMonitoringMetricValues.construct(
                     full_name=full_name,
-                    values=list(
-                        zip(
-                            sub_df.index,
-                            sub_df[mm_schemas.MetricData.METRIC_VALUE],
-                        )
-                    ),  # pyright: ignore[reportArgumentType]
+                    values=mlrun.model_monitoring.db.tsdb.helpers._df_to_points(
+                        sub_df.index, sub_df[mm_schemas.MetricData.METRIC_VALUE]
+                    ),
                 )
             )
             del metrics_without_data[full_name]
 
         for metric in metrics_without_data.values():
             metrics_values.append(
-                mm_schemas.ModelEndpointMonitoringMetricNoData(
+                mm_schemas.ModelEndpointMonitoringMetricNoData.construct(
                     full_name=metric.full_name,
                     type=mm_schemas.ModelEndpointMonitoringMetricType.METRIC,
                 )
@@ -290,16 +456,19 @@ class TSDBConnector(ABC):
                 project=project, app=app_name, name=name
             )
             metrics_values.append(
-                mm_schemas.ModelEndpointMonitoringResultValues(
+                mm_schemas.ModelEndpointMonitoringResultValues.construct(
                     full_name=full_name,
                     result_kind=result_kind,
-                    values=list(
-                        zip(
-                            sub_df.index,
-                            sub_df[mm_schemas.ResultData.RESULT_VALUE],
-                            sub_df[mm_schemas.ResultData.RESULT_STATUS],
+                    values=[
+                        (timestamp, value, mm_schemas.ResultStatusApp(status))
+                        for timestamp, value, status in (
+                            mlrun.model_monitoring.db.tsdb.helpers._df_to_points(
+                                sub_df.index,
+                                sub_df[mm_schemas.ResultData.RESULT_VALUE],
+                                sub_df[mm_schemas.ResultData.RESULT_STATUS].astype(int),
+                            )
                         )
-                    ),  # pyright: ignore[reportArgumentType]
+                    ],
                 )
             )
             del metrics_without_data[full_name]
@@ -310,7 +479,7 @@ class TSDBConnector(ABC):
             ):
                 continue
             metrics_values.append(
-                mm_schemas.ModelEndpointMonitoringMetricNoData(
+                mm_schemas.ModelEndpointMonitoringMetricNoData.construct(
                     full_name=metric.full_name,
                     type=mm_schemas.ModelEndpointMonitoringMetricType.RESULT,
                 )
@@ -11,6 +11,8 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import typing
+
 import pandas as pd
 
 import mlrun.common.schemas.model_monitoring as mm_schemas
@@ -27,4 +29,12 @@ def _get_result_kind(result_df: pd.DataFrame) -> mm_schemas.ResultKindApp:
             application_name=result_df[mm_schemas.WriterEvent.APPLICATION_NAME],
             result_name=result_df[mm_schemas.ResultData.RESULT_NAME],
         )
-    return unique_kinds[0]
+    return mm_schemas.ResultKindApp(int(unique_kinds[0]))
+
+
+def _df_to_points(index: pd.Index, *columns: pd.Series) -> list[tuple[typing.Any, ...]]:
+    """
+    Zip a time index and value columns into a list of points. Each column is converted to Python objects in
+    bulk, instead of boxing its elements one by one while iterating.
+    """
+    return list(zip(index.tolist(), *(column.tolist() for column in columns)))
@@ -89,6 +89,38 @@ class TDEngineSchema:
         values = ", ".join(f"'{values[val]}'" for val in self.columns)
         return f"INSERT INTO {self.database}.{subtable} VALUES ({values});"
 
+    def _insert_subtables_query(
+        self,
+        subtables_values: dict[
+            str, list[dict[str, Union[str, int, float, datetime.datetime]]]
+        ],
+    ) -> str:
+        """
+        Insert rows into multiple subtables in a single query. Subtables that do not exist are created
+        automatically, using the tags of their first row.
+        """
+        with StringIO() as query:
+            query.write("INSERT INTO")
+            for subtable, rows in subtables_values.items():
+                try:
+                    tags = ", ".join(f"'{rows[0][tag]}'" for tag in self.tags)
+                except KeyError:
+                    raise mlrun.errors.MLRunInvalidArgumentError(
+                        f"values must contain all tags: {self.tags.keys()}"
+                    )
+                query.write(
+                    f" {self.database}.{subtable} USING {self.database}.{self.super_table} "
+                    f"TAGS ({tags}) VALUES "
+                )
+                query.write(
+                    " ".join(
+                        "(" + ", ".join(f"'{row[val]}'" for val in self.columns) + ")"
+                        for row in rows
+                    )
+                )
+            query.write(";")
+            return query.getvalue()
+
     def _delete_subtable_query(
         self,
         subtable: str,
@@ -103,11 +135,18 @@ class TDEngineSchema:
             )
         return f"DELETE FROM {self.database}.{subtable} WHERE {values};"
 
-    def _drop_subtable_query(
+    def _drop_subtables_query(
         self,
-        subtable: str,
+        subtables: list[str],
     ) -> str:
-        return f"DROP TABLE if EXISTS {self.database}.{subtable};"
+        if not subtables:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                "subtables must contain at least one subtable"
+            )
+        tables = ", ".join(
+            f"if EXISTS {self.database}.{subtable}" for subtable in subtables
+        )
+        return f"DROP TABLE {tables};"
 
     def _get_subtables_query(
         self,
@@ -168,14 +207,15 @@ class TDEngineSchema:
                 query.write("*")
             query.write(f" FROM {database}.{table}")
 
-            if any([filter_query, start, end]):
-                query.write(" WHERE ")
-                if filter_query:
-                    query.write(f"{filter_query} AND ")
-                if start:
-                    query.write(f"{timestamp_column} >= '{start}'" + " AND ")
-                if end:
-                    query.write(f"{timestamp_column} <= '{end}'")
+            conditions = []
+            if filter_query:
+                conditions.append(filter_query)
+            if start:
+                conditions.append(f"{timestamp_column} >= '{start}'")
+            if end:
+                conditions.append(f"{timestamp_column} <= '{end}'")
+            if conditions:
+                query.write(" WHERE " + " AND ".join(conditions))
             if interval:
                 query.write(f" INTERVAL({interval})")
             if sliding_window_step:
@@ -19,6 +19,7 @@ import pandas as pd
 import taosws
 
 import mlrun.common.schemas.model_monitoring as mm_schemas
+import mlrun.model_monitoring.db.tsdb.helpers
 import mlrun.model_monitoring.db.tsdb.tdengine.schemas as tdengine_schemas
 import mlrun.model_monitoring.db.tsdb.tdengine.stream_graph_steps
 from mlrun.model_monitoring.db import TSDBConnector
@@ -74,21 +75,15 @@ class TDEngineConnector(TSDBConnector):
             create_table_query = self.tables[table]._create_super_table_query()
             self._connection.execute(create_table_query)
 
-    def write_application_event(
-        self,
-        event: dict,
-        kind: mm_schemas.WriterEventKind = mm_schemas.WriterEventKind.RESULT,
-    ):
-        """
-        Write a single result or metric to TSDB.
-        """
-
+    def _get_subtable(
+        self, event: dict, kind: mm_schemas.WriterEventKind
+    ) -> tuple[tdengine_schemas.TDEngineSchema, str]:
+        """Get the supertable schema and the subtable name of a result or metric event."""
         table_name = (
             f"{self.project}_"
             f"{event[mm_schemas.WriterEvent.ENDPOINT_ID]}_"
             f"{event[mm_schemas.WriterEvent.APPLICATION_NAME]}_"
         )
-        event[mm_schemas.EventFieldType.PROJECT] = self.project
 
         if kind == mm_schemas.WriterEventKind.RESULT:
             # Write a new result
@@ -104,6 +99,27 @@ class TDEngineConnector(TSDBConnector):
                 f"{table_name}_" f"{event[mm_schemas.MetricData.METRIC_NAME]}"
             ).replace("-", "_")
 
+        return table, table_name
+
+    @staticmethod
+    def _validate_batch_size(batch_size: int) -> None:
+        if not isinstance(batch_size, int) or batch_size <= 0:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                f"batch_size must be a positive integer, got {batch_size}"
+            )
+
+    def write_application_event(
+        self,
+        event: dict,
+        kind: mm_schemas.WriterEventKind = mm_schemas.WriterEventKind.RESULT,
+    ):
+        """
+        Write a single result or metric to TSDB.
+        """
+
+        event[mm_schemas.EventFieldType.PROJECT] = self.project
+        table, table_name = self._get_subtable(event=event, kind=kind)
+
         create_table_query = table._create_subtable_query(
             subtable=table_name, values=event
         )
@@ -113,6 +129,36 @@ class TDEngineConnector(TSDBConnector):
         )
         self._connection.execute(insert_table_query)
 
+    def batch_write_application_events(
+        self,
+        events: list[dict],
+        kind: mm_schemas.WriterEventKind = mm_schemas.WriterEventKind.RESULT,
+        batch_size: int = 50,
+    ) -> None:
+        """
+        Write multiple results or metrics of the same kind to TSDB, inserting up to `batch_size` events in a
+        single query.
+
+        :param events:     The results or metrics to write.
+        :param kind:       The kind of all the events - result or metric.
+        :param batch_size: The maximum number of events to insert in a single query. A result row may hold up to
+                           10KB of current stats, so the default keeps each query well below the 1MB SQL length
+                           limit of TDengine.
+        :raise MLRunInvalidArgumentError: If `batch_size` is not a positive integer.
+        """
+        self._validate_batch_size(batch_size)
+        for i in range(0, len(events), batch_size):
+            subtables_values: dict[str, list[dict]] = {}
+            for event in events[i : i + batch_size]:
+                event[mm_schemas.EventFieldType.PROJECT] = self.project
+                table, table_name = self._get_subtable(event=event, kind=kind)
+                subtables_values.setdefault(table_name, []).append(event)
+
+            insert_query = table._insert_subtables_query(
+                subtables_values=subtables_values
+            )
+            self._connection.execute(insert_query)
+
     def apply_monitoring_stream_steps(self, graph):
         """
         Apply TSDB steps on the provided monitoring graph. Throughout these steps, the graph stores live data of
@@ -156,18 +202,25 @@ class TDEngineConnector(TSDBConnector):
             after="ProcessBeforeTDEngine",
         )
 
-    def delete_tsdb_resources(self):
+    def delete_tsdb_resources(self, batch_size: int = 1000):
         """
         Delete all project resources in the TSDB connector, such as model endpoints data and drift results.
+
+        :param batch_size: The maximum number of subtables to drop in a single query.
+        :raise MLRunInvalidArgumentError: If `batch_size` is not a positive integer.
         """
+        self._validate_batch_size(batch_size)
         for table in self.tables:
             get_subtable_names_query = self.tables[table]._get_subtables_query(
                 values={mm_schemas.EventFieldType.PROJECT: self.project}
             )
-            subtables = self._connection.query(get_subtable_names_query)
-            for subtable in subtables:
-                drop_query = self.tables[table]._drop_subtable_query(
-                    subtable=subtable[0]
+            subtables = [
+                subtable[0]
+                for subtable in self._connection.query(get_subtable_names_query)
+            ]
+            for i in range(0, len(subtables), batch_size):
+                drop_query = self.tables[table]._drop_subtables_query(
+                    subtables=subtables[i : i + batch_size]
                 )
                 self._connection.execute(drop_query)
         logger.info(
@@ -189,6 +242,7 @@ class TDEngineConnector(TSDBConnector):
         table: str,
         start: datetime,
         end: datetime,
+        *,
         columns: typing.Optional[list[str]] = None,
         filter_query: typing.Optional[str] = None,
         interval: typing.Optional[str] = None,
@@ -207,9 +261,9 @@ class TDEngineConnector(TSDBConnector):
         :param interval:              The interval to aggregate the data by. Note that if interval is provided,
                                       `agg_funcs` must bg provided as well. Provided as a string in the format of '1m',
                                       '1h', etc.
-        :param agg_funcs:             The aggregation functions to apply on the columns. Note that if `agg_funcs` is
-                                      provided, `interval` must bg provided as well. Provided as a list of strings in
-                                      the format of ['sum', 'avg', 'count', ...].
+        :param agg_funcs:             The aggregation functions to apply on the columns. If `interval` is not
+                                      provided, the functions are applied over the whole time range. Provided as a
+                                      list of strings in the format of ['sum', 'avg', 'count', ...].
         :param limit:                 The maximum number of records to return.
         :param sliding_window_step:   The time step for which the time window moves forward. Note that if
                                       `sliding_window_step` is provided, interval must be provided as well. Provided
@@ -351,7 +405,7 @@ class TDEngineConnector(TSDBConnector):
         full_name = get_invocations_fqn(self.project)
 
         if df.empty:
-            return mm_schemas.ModelEndpointMonitoringMetricNoData(
+            return mm_schemas.ModelEndpointMonitoringMetricNoData.construct(
                 full_name=full_name,
                 type=mm_schemas.ModelEndpointMonitoringMetricType.METRIC,
             )
@@ -367,16 +421,33 @@ class TDEngineConnector(TSDBConnector):
             else mm_schemas.EventFieldType.LATENCY
         )
 
-        return mm_schemas.ModelEndpointMonitoringMetricValues(
+        return mm_schemas.ModelEndpointMonitoringMetricValues.construct(
             full_name=full_name,
-            values=list(
-                zip(
-                    df.index,
-                    df[latency_column],
-                )
-            ),  # pyright: ignore[reportArgumentType]
+            values=mlrun.model_monitoring.db.tsdb.helpers._df_to_points(
+                df.index, df[latency_column]
+            ),
         )
 
+    def read_latest_point(
+        self,
+        *,
+        endpoint_id: str,
+        metric: str = mm_schemas.EventFieldType.LATENCY,
+    ) -> typing.Optional[tuple[datetime, float]]:
+        # LAST_ROW is served from the TDEngine last row cache when it is enabled
+        df = self._get_records(
+            table=mm_schemas.TDEngineSuperTables.PREDICTIONS,
+            start=None,
+            end=None,
+            columns=[mm_schemas.EventFieldType.TIME, metric],
+            filter_query=f"endpoint_id='{endpoint_id}'",
+            agg_funcs=["last_row"],
+        )
+        if df.empty:
+            return None
+        timestamp, value = df.iloc[0]
+        return pd.to_datetime(timestamp), float(value)
+
     # Note: this function serves as a reference for checking the TSDB for the existence of a metric.
     #
     # def read_prediction_metric_for_endpoint_if_exists(
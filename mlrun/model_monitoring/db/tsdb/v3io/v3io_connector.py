@@ -23,6 +23,7 @@ import v3io_frames.client
 import mlrun.common.model_monitoring
 import mlrun.common.schemas.model_monitoring as mm_schemas
 import mlrun.feature_store.steps
+import mlrun.model_monitoring.db.tsdb.helpers
 import mlrun.utils.v3io_clients
 from mlrun.model_monitoring.db import TSDBConnector
 from mlrun.model_monitoring.helpers import get_invocations_fqn
@@ -31,6 +32,7 @@ from mlrun.utils import logger
 _TSDB_BE = "tsdb"
 _TSDB_RATE = "1/s"
 _CONTAINER = "users"
+_LATEST_POINT_LOOKBACK = "1h"
 
 
 def _is_no_schema_error(exc: v3io_frames.ReadError) -> bool:
@@ -261,10 +263,17 @@ class V3IOTSDBConnector(TSDBConnector):
         kind: mm_schemas.WriterEventKind = mm_schemas.WriterEventKind.RESULT,
     ) -> None:
         """Write a single result or metric to TSDB"""
+        self.batch_write_application_events(events=[event], kind=kind)
+
+    def batch_write_application_events(
+        self,
+        events: list[dict],
+        kind: mm_schemas.WriterEventKind = mm_schemas.WriterEventKind.RESULT,
+    ) -> None:
+        """Write multiple results or metrics of the same kind to TSDB in a single frames write"""
+        if not events:
+            return
 
-        event[mm_schemas.WriterEvent.END_INFER_TIME] = datetime.fromisoformat(
-            event[mm_schemas.WriterEvent.END_INFER_TIME]
-        )
         index_cols_base = [
             mm_schemas.WriterEvent.END_INFER_TIME,
             mm_schemas.WriterEvent.ENDPOINT_ID,
@@ -277,15 +286,21 @@ class V3IOTSDBConnector(TSDBConnector):
         elif kind == mm_schemas.WriterEventKind.RESULT:
             table = self.tables[mm_schemas.V3IOTSDBTables.APP_RESULTS]
             index_cols = index_cols_base + [mm_schemas.ResultData.RESULT_NAME]
-            del event[mm_schemas.ResultData.RESULT_EXTRA_DATA]
         else:
             raise ValueError(f"Invalid {kind = }")
 
+        for event in events:
+            event[mm_schemas.WriterEvent.END_INFER_TIME] = datetime.fromisoformat(
+                event[mm_schemas.WriterEvent.END_INFER_TIME]
+            )
+            if kind == mm_schemas.WriterEventKind.RESULT:
+                del event[mm_schemas.ResultData.RESULT_EXTRA_DATA]
+
         try:
             self._frames_client.write(
                 backend=_TSDB_BE,
                 table=table,
-                dfs=pd.DataFrame.from_records([event]),
+                dfs=pd.DataFrame.from_records(events),
                 index_cols=index_cols,
             )
             logger.info("Updated V3IO TSDB successfully", table=table)
@@ -294,7 +309,7 @@ class V3IOTSDBConnector(TSDBConnector):
                 "Could not write drift measures to TSDB",
                 err=err,
                 table=table,
-                event=event,
+                events=events,
             )
             raise mlrun.errors.MLRunRuntimeError(
                 f"Failed to write application result to TSDB: {err}"
@@ -360,16 +375,12 @@ class V3IOTSDBConnector(TSDBConnector):
             )
 
             # Fill the metrics mapping dictionary with the metric name and values
-            data_dict = data.to_dict()
+            timestamps = data.index.astype(str).tolist()
             for metric in metrics:
-                metric_data = data_dict.get(metric)
-                if metric_data is None:
+                if metric not in data.columns:
                     continue
 
-                values = [
-                    (str(timestamp), value) for timestamp, value in metric_data.items()
-                ]
-                metrics_mapping[metric] = values
+                metrics_mapping[metric] = list(zip(timestamps, data[metric].tolist()))
 
         except v3io_frames.Error as err:
             logger.warn("Failed to read tsdb", err=err, endpoint=endpoint_id)
@@ -381,6 +392,7 @@ class V3IOTSDBConnector(TSDBConnector):
         table: str,
         start: Union[datetime, str],
         end: Union[datetime, str],
+        *,
         columns: Optional[list[str]] = None,
         filter_query: str = "",
         interval: Optional[str] = None,
@@ -606,7 +618,7 @@ class V3IOTSDBConnector(TSDBConnector):
         full_name = get_invocations_fqn(self.project)
 
         if df.empty:
-            return mm_schemas.ModelEndpointMonitoringMetricNoData(
+            return mm_schemas.ModelEndpointMonitoringMetricNoData.construct(
                 full_name=full_name,
                 type=mm_schemas.ModelEndpointMonitoringMetricType.METRIC,
             )
@@ -617,16 +629,33 @@ class V3IOTSDBConnector(TSDBConnector):
             else mm_schemas.EventFieldType.LATENCY
         )
 
-        return mm_schemas.ModelEndpointMonitoringMetricValues(
+        return mm_schemas.ModelEndpointMonitoringMetricValues.construct(
             full_name=full_name,
-            values=list(
-                zip(
-                    df.index,
-                    df[latency_column],
-                )
-            ),  # pyright: ignore[reportArgumentType]
+            values=mlrun.model_monitoring.db.tsdb.helpers._df_to_points(
+                df.index, df[latency_column]
+            ),
         )
 
+    def read_latest_point(
+        self,
+        *,
+        endpoint_id: str,
+        metric: str = mm_schemas.EventFieldType.LATENCY,
+    ) -> Optional[tuple[datetime, float]]:
+        # V3IO TSDB cannot scan backwards, so look for the latest record in a recent time window only. The raw
+        # records are read, as the aggregated records are stamped with the start of their window.
+        df = self._get_records(
+            table=mm_schemas.FileTargetKind.PREDICTIONS,
+            start=f"now-{_LATEST_POINT_LOOKBACK}",
+            end="now",
+            columns=[metric],
+            filter_query=f"endpoint_id=='{endpoint_id}'",
+        )
+        if df.empty:
+            return None
+        latest = df.index.argmax()
+        return df.index[latest], float(df[metric].iloc[latest])
+
     # Note: this function serves as a reference for checking the TSDB for the existence of a metric.
     #
     # def read_prediction_metric_for_endpoint_if_exists(
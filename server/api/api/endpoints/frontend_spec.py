@@ -65,7 +65,9 @@ def get_frontend_spec(
     function_target_image_name_prefix_template = (
         config.httpdb.builder.function_target_image_name_prefix_template
     )
-    return mlrun.common.schemas.FrontendSpec(
+    # the spec is built from trusted server configuration, so skip validating it here - it is validated once
+    # by the response model
+    return mlrun.common.schemas.FrontendSpec.construct(
         jobs_dashboard_url=jobs_dashboard_url,
         model_monitoring_dashboard_url=model_monitoring_dashboard_url,
         abortable_function_kinds=mlrun.runtimes.RuntimeKinds.abortable_runtimes(),
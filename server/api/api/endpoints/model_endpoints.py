@@ -18,7 +18,7 @@ from collections.abc import Coroutine
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from http import HTTPStatus
-from typing import Annotated, Literal, Optional, Union
+from typing import Annotated, Literal, Optional
 
 from fastapi import APIRouter, Depends, Query
 from fastapi.concurrency import run_in_threadpool
@@ -468,23 +468,11 @@ async def _wrap_coroutine_in_list(x):
 
 @router.get(
     "/{endpoint_id}/metrics-values",
-    response_model=list[
-        Union[
-            mm_endpoints.ModelEndpointMonitoringMetricValues,
-            mm_endpoints.ModelEndpointMonitoringResultValues,
-            mm_endpoints.ModelEndpointMonitoringMetricNoData,
-        ]
-    ],
+    response_model=list[mm_endpoints.ModelEndpointMonitoringValues],
 )
 async def get_model_endpoint_monitoring_metrics_values(
     params: Annotated[_MetricsValuesParams, Depends(_get_metrics_values_params)],
-) -> list[
-    Union[
-        mm_endpoints.ModelEndpointMonitoringMetricValues,
-        mm_endpoints.ModelEndpointMonitoringResultValues,
-        mm_endpoints.ModelEndpointMonitoringMetricNoData,
-    ]
-]:
+) -> list[mm_endpoints.ModelEndpointMonitoringValues]:
     """
     :param params: A combined object with all the request parameters.
 
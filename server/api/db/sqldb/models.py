@@ -570,7 +570,10 @@ with warnings.catch_warnings():
 
     class HubSource(Base, mlrun.utils.db.BaseModel):
         __tablename__ = "hub_sources"
-        __table_args__ = (UniqueConstraint("name", name="_hub_sources_uc"),)
+        __table_args__ = (
+            UniqueConstraint("name", name="_hub_sources_uc"),
+            Index("idx_hub_sources_index", "index"),
+        )
 
         id = Column(Integer, primary_key=True)
         name = Column(String(255, collation=SQLTypesUtil.collation()))
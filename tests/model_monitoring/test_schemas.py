@@ -16,11 +16,16 @@ from contextlib import AbstractContextManager
 from contextlib import nullcontext as does_not_raise
 from typing import Optional
 
+import pydantic
 import pytest
 
 from mlrun.common.schemas.model_monitoring.model_endpoints import (
     ModelEndpointMonitoringMetric,
+    ModelEndpointMonitoringMetricNoData,
     ModelEndpointMonitoringMetricType,
+    ModelEndpointMonitoringMetricValues,
+    ModelEndpointMonitoringResultValues,
+    ModelEndpointMonitoringValues,
     _parse_metric_fqn_to_monitoring_metric,
 )
 
@@ -61,3 +66,30 @@ def test_fqn_parsing(
 ) -> None:
     with expectation:
         assert _parse_metric_fqn_to_monitoring_metric(fqn) == expected_result
+
+
+def test_monitoring_values_discriminator() -> None:
+    values = [
+        ModelEndpointMonitoringMetricValues(
+            full_name="proj.app.metric.m1", values=[("2024-04-02 18:00:00", 1.0)]
+        ),
+        ModelEndpointMonitoringResultValues(
+            full_name="proj.app.result.r1",
+            result_kind=0,
+            values=[("2024-04-02 18:00:00", 0.5, 1)],
+        ),
+        ModelEndpointMonitoringMetricNoData(
+            full_name="proj.app.result.r2",
+            type=ModelEndpointMonitoringMetricType.RESULT,
+        ),
+    ]
+    parsed = pydantic.parse_obj_as(
+        list[ModelEndpointMonitoringValues], [value.dict() for value in values]
+    )
+    assert parsed == values
+
+    with pytest.raises(pydantic.ValidationError):
+        pydantic.parse_obj_as(
+            ModelEndpointMonitoringValues,
+            {"kind": "unknown", "full_name": "proj.app.metric.m1"},
+        )
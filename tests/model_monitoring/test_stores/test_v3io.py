@@ -475,6 +475,26 @@ def predictions_df() -> pd.DataFrame:
     )
 
 
+@pytest.fixture
+def real_time_metrics_df() -> pd.DataFrame:
+    return pd.DataFrame.from_records(
+        [
+            (
+                pd.Timestamp("2024-04-02 18:00:00", tz="UTC"),
+                "70450e1ef7cc9506d42369aeeb056eaaaa0bb8bd",
+                0.5,
+            ),
+            (
+                pd.Timestamp("2024-04-02 18:01:00", tz="UTC"),
+                "70450e1ef7cc9506d42369aeeb056eaaaa0bb8bd",
+                1.5,
+            ),
+        ],
+        index="time",
+        columns=["time", "endpoint_id", "predictions_per_second"],
+    )
+
+
 @pytest.fixture
 def _mock_frames_client(tsdb_df: pd.DataFrame) -> Iterator[None]:
     frames_client_mock = Mock()
@@ -497,6 +517,19 @@ def _mock_frames_client_predictions(predictions_df: pd.DataFrame) -> Iterator[No
         yield
 
 
+@pytest.fixture
+def _mock_frames_client_real_time_metrics(
+    real_time_metrics_df: pd.DataFrame,
+) -> Iterator[None]:
+    frames_client_mock = Mock()
+    frames_client_mock.read = Mock(return_value=real_time_metrics_df)
+
+    with patch.object(
+        mlrun.utils.v3io_clients, "get_frames_client", return_value=frames_client_mock
+    ):
+        yield
+
+
 @pytest.mark.usefixtures("_mock_frames_client")
 def test_read_results_data() -> None:
     data = V3IOTSDBConnector(project="fictitious-one").read_metrics_data(
@@ -532,6 +565,16 @@ def test_read_results_data() -> None:
     assert counter[ModelEndpointMonitoringResultValues] == 2
     assert counter[ModelEndpointMonitoringMetricNoData] == 1
 
+    for values in data:
+        # The values are built without validation, check they are typed and serializable as is
+        values.json()
+        if isinstance(values, ModelEndpointMonitoringResultValues):
+            assert values.result_kind == mm_constants.ResultKindApp.data_drift
+            assert all(
+                isinstance(status, mm_constants.ResultStatusApp)
+                for _, _, status in values.values
+            )
+
 
 @pytest.mark.usefixtures("_mock_frames_client_predictions")
 def test_read_predictions() -> None:
@@ -565,6 +608,24 @@ def test_read_predictions() -> None:
     ]
 
 
+@pytest.mark.usefixtures("_mock_frames_client_real_time_metrics")
+def test_get_model_endpoint_real_time_metrics() -> None:
+    metrics = V3IOTSDBConnector(
+        project="fictitious-one"
+    ).get_model_endpoint_real_time_metrics(
+        endpoint_id="70450e1ef7cc9506d42369aeeb056eaaaa0bb8bd",
+        metrics=["predictions_per_second", "latency_avg_5m"],
+        start="now-1h",
+        end="now",
+    )
+    assert metrics == {
+        "predictions_per_second": [
+            ("2024-04-02 18:00:00+00:00", 0.5),
+            ("2024-04-02 18:01:00+00:00", 1.5),
+        ]
+    }
+
+
 @pytest.mark.parametrize(
     ("input_event", "expected_output"),
     [
@@ -579,3 +640,80 @@ def test_normalize_dict_for_v3io_frames(
     input_event: dict[str, Any], expected_output: dict[str, Any]
 ) -> None:
     assert _normalize_dict_for_v3io_frames(input_event) == expected_output
+
+
+@pytest.fixture
+def frames_client_mock() -> Iterator[Mock]:
+    frames_client_mock = Mock()
+    with patch.object(
+        mlrun.utils.v3io_clients, "get_frames_client", return_value=frames_client_mock
+    ):
+        yield frames_client_mock
+
+
+class TestReadLatestPoint:
+    ENDPOINT_ID = "70450e1ef7cc9506d42369aeeb056eaaaa0bb8bd"
+
+    def test_latest_point(self, frames_client_mock: Mock) -> None:
+        # The raw records of the lookback window, not necessarily sorted by time
+        frames_client_mock.read = Mock(
+            return_value=pd.DataFrame.from_records(
+                [
+                    (pd.Timestamp("2024-04-02 18:00:00", tz="UTC"), 7.0),
+                    (pd.Timestamp("2024-04-02 18:01:30", tz="UTC"), 12.5),
+                    (pd.Timestamp("2024-04-02 18:01:00", tz="UTC"), 9.0),
+                ],
+                index="time",
+                columns=["time", "latency"],
+            )
+        )
+        latest_point = V3IOTSDBConnector(project="fictitious-one").read_latest_point(
+            endpoint_id=self.ENDPOINT_ID
+        )
+        assert latest_point == (pd.Timestamp("2024-04-02 18:01:30", tz="UTC"), 12.5)
+        assert type(latest_point[1]) is float
+        frames_client_mock.read.assert_called_once()
+        read_kwargs = frames_client_mock.read.call_args.kwargs
+        assert read_kwargs["start"] == "now-1h"
+        assert read_kwargs["end"] == "now"
+        assert read_kwargs["columns"] == ["latency"]
+        assert read_kwargs["aggregators"] is None
+        assert read_kwargs["filter"] == f"endpoint_id=='{self.ENDPOINT_ID}'"
+
+    def test_no_data(self, frames_client_mock: Mock) -> None:
+        frames_client_mock.read = Mock(return_value=pd.DataFrame())
+        assert (
+            V3IOTSDBConnector(project="fictitious-one").read_latest_point(
+                endpoint_id=self.ENDPOINT_ID
+            )
+            is None
+        )
+
+
+def test_batch_write_application_events(frames_client_mock: Mock) -> None:
+    events = [
+        {
+            mm_constants.WriterEvent.ENDPOINT_ID: "ep-id",
+            mm_constants.WriterEvent.APPLICATION_NAME: "some-app",
+            mm_constants.ResultData.RESULT_NAME: f"result_{i}",
+            mm_constants.ResultData.RESULT_VALUE: 0.5,
+            mm_constants.ResultData.RESULT_KIND: 0,
+            mm_constants.ResultData.RESULT_STATUS: 1,
+            mm_constants.ResultData.RESULT_EXTRA_DATA: "{}",
+            mm_constants.WriterEvent.START_INFER_TIME: "2024-05-10T13:00:00.0+00:00",
+            mm_constants.WriterEvent.END_INFER_TIME: "2024-05-10T14:00:00.0+00:00",
+        }
+        for i in range(3)
+    ]
+    V3IOTSDBConnector(project="fictitious-one").batch_write_application_events(
+        events=events, kind=mm_constants.WriterEventKind.RESULT
+    )
+    frames_client_mock.write.assert_called_once()
+    written_df = frames_client_mock.write.call_args.kwargs["dfs"]
+    assert len(written_df) == 3
+    assert mm_constants.ResultData.RESULT_EXTRA_DATA not in written_df.columns
+    assert written_df[mm_constants.ResultData.RESULT_NAME].tolist() == [
+        "result_0",
+        "result_1",
+        "result_2",
+    ]
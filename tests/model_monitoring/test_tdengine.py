@@ -14,16 +14,25 @@
 
 
 import datetime
+from collections.abc import Iterator
 from typing import Union
+from unittest.mock import Mock, patch
 
+import numpy as np
+import pandas as pd
 import pytest
+import taosws
 
 import mlrun.common.schemas
+import mlrun.common.schemas.model_monitoring as mm_schemas
 from mlrun.model_monitoring.db.tsdb.tdengine.schemas import (
     _MODEL_MONITORING_DATABASE,
     TDEngineSchema,
     _TDEngineColumn,
 )
+from mlrun.model_monitoring.db.tsdb.tdengine.tdengine_connector import (
+    TDEngineConnector,
+)
 
 _SUPER_TABLE_TEST = "super_table_test"
 _COLUMNS_TEST = {
@@ -32,6 +41,7 @@ _COLUMNS_TEST = {
     "column3": _TDEngineColumn.BINARY_40,
 }
 _TAG_TEST = {"tag1": _TDEngineColumn.INT, "tag2": _TDEngineColumn.BINARY_64}
+_PROJECT_TEST = "test-project"
 
 
 class TestTDEngineSchema:
@@ -107,6 +117,36 @@ class TestTDEngineSchema:
             with pytest.raises(KeyError):
                 super_table._insert_subtable_query(subtable=subtable, values=values)
 
+    def test_insert_subtables(
+        self,
+        super_table: TDEngineSchema,
+        values: dict[str, Union[str, int, float, datetime.datetime]],
+    ):
+        other_values = values | {"column2": 0.2}
+        assert super_table._insert_subtables_query(
+            subtables_values={
+                "subtable_1": [values, other_values],
+                "subtable_2": [values],
+            }
+        ) == (
+            f"INSERT INTO {_MODEL_MONITORING_DATABASE}.subtable_1 USING "
+            f"{_MODEL_MONITORING_DATABASE}.{super_table.super_table} "
+            f"TAGS ('{values['tag1']}', '{values['tag2']}') VALUES "
+            f"('{values['column1']}', '0.1', '{values['column3']}') "
+            f"('{values['column1']}', '0.2', '{values['column3']}') "
+            f"{_MODEL_MONITORING_DATABASE}.subtable_2 USING "
+            f"{_MODEL_MONITORING_DATABASE}.{super_table.super_table} "
+            f"TAGS ('{values['tag1']}', '{values['tag2']}') VALUES "
+            f"('{values['column1']}', '0.1', '{values['column3']}');"
+        )
+
+        # test with missing tag
+        values.pop("tag1")
+        with pytest.raises(mlrun.errors.MLRunInvalidArgumentError):
+            super_table._insert_subtables_query(
+                subtables_values={"subtable_1": [values]}
+            )
+
     @pytest.mark.parametrize(
         ("subtable", "remove_tag"), [("subtable_1", False), ("subtable_2", True)]
     )
@@ -136,11 +176,19 @@ class TestTDEngineSchema:
             with pytest.raises(mlrun.errors.MLRunInvalidArgumentError):
                 super_table._delete_subtable_query(subtable=subtable, values=values)
 
-    def test_drop_subtable(self, super_table: TDEngineSchema):
+    def test_drop_subtables(self, super_table: TDEngineSchema):
         assert (
-            super_table._drop_subtable_query(subtable="subtable_1")
+            super_table._drop_subtables_query(subtables=["subtable_1"])
             == f"DROP TABLE if EXISTS {_MODEL_MONITORING_DATABASE}.subtable_1;"
         )
+        assert (
+            super_table._drop_subtables_query(subtables=["subtable_1", "subtable_2"])
+            == f"DROP TABLE if EXISTS {_MODEL_MONITORING_DATABASE}.subtable_1, "
+            f"if EXISTS {_MODEL_MONITORING_DATABASE}.subtable_2;"
+        )
+
+        with pytest.raises(mlrun.errors.MLRunInvalidArgumentError):
+            super_table._drop_subtables_query(subtables=[])
 
     @pytest.mark.parametrize(
         ("subtable", "remove_tag"), [("subtable_1", False), ("subtable_2", True)]
@@ -239,6 +287,20 @@ class TestTDEngineSchema:
             == expected_query
         )
 
+    def test_get_records_query_without_time_range(self, super_table: TDEngineSchema):
+        assert (
+            super_table._get_records_query(
+                table="subtable_1",
+                columns_to_filter=["column1", "column2"],
+                filter_query="tag2 = 'value2'",
+                start=None,
+                end=None,
+                agg_funcs=["last_row"],
+            )
+            == f"SELECT last_row(column1), last_row(column2) FROM {_MODEL_MONITORING_DATABASE}.subtable_1 "
+            f"WHERE tag2 = 'value2';"
+        )
+
     @pytest.mark.parametrize(
         (
             "subtable",
@@ -359,3 +421,146 @@ class TestTDEngineSchema:
             )
             == expected_query
         )
+
+
+class _QueryResult(list):
+    """A minimal stand-in for the result of `taosws.Connection.query`."""
+
+    def __init__(self, rows: list[tuple], columns: list[str]) -> None:
+        super().__init__(rows)
+        self.fields = [Mock(**{"name.return_value": column}) for column in columns]
+
+
+class TestTDEngineConnector:
+    """Tests for the TDEngineConnector class with a mocked TDengine connection."""
+
+    @staticmethod
+    @pytest.fixture
+    def connection() -> Iterator[Mock]:
+        connection = Mock()
+        with patch.object(taosws, "connect", return_value=connection):
+            yield connection
+
+    @staticmethod
+    @pytest.fixture
+    def connector(connection: Mock) -> TDEngineConnector:
+        connector = TDEngineConnector(
+            project=_PROJECT_TEST, connection_string="taosws://localhost:6041"
+        )
+        # Ignore the queries of the connection setup
+        connection.reset_mock()
+        return connector
+
+    def test_delete_tsdb_resources(
+        self, connector: TDEngineConnector, connection: Mock
+    ):
+        subtables = [(f"subtable_{i}",) for i in range(2501)]
+        # Only the first super table has subtables of the project
+        connection.query.side_effect = [subtables, [], []]
+        connector.delete_tsdb_resources()
+        assert connection.query.call_count == len(connector.tables)
+        assert [
+            call.args[0].count(" if EXISTS ")
+            for call in connection.execute.call_args_list
+        ] == [1000, 1000, 501]
+        last_drop_query = connection.execute.call_args.args[0]
+        assert last_drop_query.startswith(
+            f"DROP TABLE if EXISTS {_MODEL_MONITORING_DATABASE}.subtable_2000, "
+        )
+        assert last_drop_query.endswith(
+            f"if EXISTS {_MODEL_MONITORING_DATABASE}.subtable_2500;"
+        )
+
+    @pytest.mark.parametrize("batch_size", [0, -1, None])
+    def test_delete_tsdb_resources_invalid_batch_size(
+        self, connector: TDEngineConnector, connection: Mock, batch_size
+    ):
+        with pytest.raises(mlrun.errors.MLRunInvalidArgumentError):
+            connector.delete_tsdb_resources(batch_size=batch_size)
+        connection.query.assert_not_called()
+        connection.execute.assert_not_called()
+
+    @staticmethod
+    def _get_metric_events(count: int) -> list[dict[str, Union[str, float]]]:
+        return [
+            {
+                mm_schemas.WriterEvent.ENDPOINT_ID: "ep-id",
+                mm_schemas.WriterEvent.APPLICATION_NAME: "some-app",
+                mm_schemas.MetricData.METRIC_NAME: f"metric_{i % 2}",
+                mm_schemas.MetricData.METRIC_VALUE: 0.1 * i,
+                mm_schemas.WriterEvent.START_INFER_TIME: "2024-05-10 13:00:00",
+                mm_schemas.WriterEvent.END_INFER_TIME: "2024-05-10 14:00:00",
+            }
+            for i in range(count)
+        ]
+
+    def test_batch_write_application_events(
+        self, connector: TDEngineConnector, connection: Mock
+    ):
+        connector.batch_write_application_events(
+            events=self._get_metric_events(3),
+            kind=mm_schemas.WriterEventKind.METRIC,
+        )
+        connection.execute.assert_called_once()
+        query = connection.execute.call_args.args[0]
+        assert query.startswith("INSERT INTO")
+        assert query.count(" USING ") == 2
+        assert "test_project_ep_id_some_app__metric_0 USING" in query
+        assert "test_project_ep_id_some_app__metric_1 USING" in query
+
+    def test_batch_write_application_events_in_batches(
+        self, connector: TDEngineConnector, connection: Mock
+    ):
+        connector.batch_write_application_events(
+            events=self._get_metric_events(5),
+            kind=mm_schemas.WriterEventKind.METRIC,
+            batch_size=2,
+        )
+        assert connection.execute.call_count == 3
+        # Each inserted row starts with its end infer time
+        assert [
+            call.args[0].count("('2024-05-10 14:00:00'")
+            for call in connection.execute.call_args_list
+        ] == [2, 2, 1]
+
+    @pytest.mark.parametrize("batch_size", [0, -1, None])
+    def test_batch_write_invalid_batch_size(
+        self, connector: TDEngineConnector, connection: Mock, batch_size
+    ):
+        with pytest.raises(mlrun.errors.MLRunInvalidArgumentError):
+            connector.batch_write_application_events(
+                events=self._get_metric_events(1),
+                kind=mm_schemas.WriterEventKind.METRIC,
+                batch_size=batch_size,
+            )
+        connection.execute.assert_not_called()
+
+    def test_batch_write_no_events(
+        self, connector: TDEngineConnector, connection: Mock
+    ):
+        connector.batch_write_application_events(
+            events=[], kind=mm_schemas.WriterEventKind.METRIC
+        )
+        connection.execute.assert_not_called()
+
+    def test_read_latest_point(self, connector: TDEngineConnector, connection: Mock):
+        connection.query.return_value = _QueryResult(
+            rows=[("2024-04-02 18:01:00.000", np.float32(12.5))],
+            columns=["last_row(time)", "last_row(latency)"],
+        )
+        latest_point = connector.read_latest_point(endpoint_id="ep-id")
+        assert latest_point == (pd.Timestamp("2024-04-02 18:01:00"), 12.5)
+        assert type(latest_point[1]) is float
+        connection.query.assert_called_once_with(
+            "SELECT last_row(time), last_row(latency) FROM "
+            f"{_MODEL_MONITORING_DATABASE}.{mm_schemas.TDEngineSuperTables.PREDICTIONS} "
+            f"WHERE endpoint_id='ep-id' AND project = '{_PROJECT_TEST}';"
+        )
+
+    def test_read_latest_point_no_data(
+        self, connector: TDEngineConnector, connection: Mock
+    ):
+        connection.query.return_value = _QueryResult(
+            rows=[], columns=["last_row(time)", "last_row(latency)"]
+        )
+        assert connector.read_latest_point(endpoint_id="ep-id") is None
@@ -0,0 +1,256 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional, Union
+
+import pandas as pd
+import pytest
+
+import mlrun.common.schemas.model_monitoring as mm_schemas
+import mlrun.errors
+from mlrun.model_monitoring.db.tsdb.base import TSDBConnector
+
+_PROJECT = "test-project"
+
+
+class _StubTSDBConnector(TSDBConnector):
+    """
+    A TSDB connector that records the read and write calls instead of querying a TSDB.
+    The metrics have data at the times in `points`.
+    """
+
+    type = "stub"
+
+    def __init__(self, points: Optional[dict[str, list[datetime]]] = None) -> None:
+        super().__init__(project=_PROJECT)
+        self.points = points or {}
+        self.read_calls: list[dict[str, Any]] = []
+        self.write_calls: list[dict[str, Any]] = []
+
+    def apply_monitoring_stream_steps(self, graph) -> None:
+        pass
+
+    def write_application_event(
+        self,
+        event: dict,
+        kind: mm_schemas.WriterEventKind = mm_schemas.WriterEventKind.RESULT,
+    ) -> None:
+        self.write_calls.append({"event": event, "kind": kind})
+
+    def delete_tsdb_resources(self) -> None:
+        pass
+
+    def get_model_endpoint_real_time_metrics(
+        self, endpoint_id: str, metrics: list[str], start: str, end: str
+    ) -> dict[str, list[tuple[str, float]]]:
+        return {}
+
+    def _get_records(
+        self,
+        table: str,
+        start: Union[datetime, str],
+        end: Union[datetime, str],
+        **kwargs,
+    ) -> pd.DataFrame:
+        return pd.DataFrame()
+
+    def create_tables(self) -> None:
+        pass
+
+    def read_metrics_data(
+        self,
+        *,
+        endpoint_id: str,
+        start: datetime,
+        end: datetime,
+        metrics: list[mm_schemas.ModelEndpointMonitoringMetric],
+        type: str,
+    ) -> list[
+        Union[
+            mm_schemas.ModelEndpointMonitoringMetricValues,
+            mm_schemas.ModelEndpointMonitoringMetricNoData,
+        ]
+    ]:
+        self.read_calls.append(
+            {"start": start, "end": end, "metrics": metrics, "type": type}
+        )
+        metrics_values = []
+        for metric in metrics:
+            points = [
+                (timestamp, 1.0)
+                for timestamp in self.points.get(metric.full_name, [])
+                if start <= timestamp <= end
+            ]
+            if points:
+                metrics_values.append(
+                    mm_schemas.ModelEndpointMonitoringMetricValues(
+                        full_name=metric.full_name, values=points
+                    )
+                )
+            else:
+                metrics_values.append(
+                    mm_schemas.ModelEndpointMonitoringMetricNoData(
+                        full_name=metric.full_name,
+                        type=mm_schemas.ModelEndpointMonitoringMetricType.METRIC,
+                    )
+                )
+        return metrics_values
+
+    def read_predictions(
+        self, **kwargs
+    ) -> mm_schemas.ModelEndpointMonitoringMetricNoData:
+        return mm_schemas.ModelEndpointMonitoringMetricNoData(
+            full_name="invocations",
+            type=mm_schemas.ModelEndpointMonitoringMetricType.METRIC,
+        )
+
+    def read_latest_point(
+        self,
+        *,
+        endpoint_id: str,
+        metric: str = mm_schemas.EventFieldType.LATENCY,
+    ) -> Optional[tuple[datetime, float]]:
+        return None
+
+
+def _get_metrics(count: int) -> list[mm_schemas.ModelEndpointMonitoringMetric]:
+    return [
+        mm_schemas.ModelEndpointMonitoringMetric(
+            project=_PROJECT,
+            app="app",
+            name=f"metric_{i}",
+            full_name=f"{_PROJECT}.app.metric.metric_{i}",
+            type=mm_schemas.ModelEndpointMonitoringMetricType.METRIC,
+        )
+        for i in range(count)
+    ]
+
+
+class TestReadMetricsDataStream:
+    START = datetime(2024, 4, 1, tzinfo=timezone.utc)
+
+    def test_chunks(self) -> None:
+        metrics = _get_metrics(5)
+        end = self.START + timedelta(days=2, hours=12)
+        # Every metric has data in every window
+        connector = _StubTSDBConnector(
+            points={
+                metric.full_name: [
+                    self.START + timedelta(days=day, hours=6) for day in range(3)
+                ]
+                for metric in metrics
+            }
+        )
+        chunks = list(
+            connector.read_metrics_data_stream(
+                endpoint_id="ep-id",
+                start=self.START,
+                end=end,
+                metrics=metrics,
+                type="metrics",
+                chunk_size=2,
+                chunk_interval=timedelta(days=1),
+            )
+        )
+        # 3 time windows, each read in 3 chunks of metrics
+        assert len(chunks) == len(connector.read_calls) == 9
+        assert [call["metrics"] for call in connector.read_calls[:3]] == [
+            metrics[0:2],
+            metrics[2:4],
+            metrics[4:5],
+        ]
+        windows = [(call["start"], call["end"]) for call in connector.read_calls[::3]]
+        millisecond = timedelta(milliseconds=1)
+        assert windows == [
+            (self.START, self.START + timedelta(days=1) - millisecond),
+            (
+                self.START + timedelta(days=1),
+                self.START + timedelta(days=2) - millisecond,
+            ),
+            (self.START + timedelta(days=2), end),
+        ]
+        assert all(values.data for chunk in chunks for values in chunk)
+
+    def test_no_data(self) -> None:
+        metrics = _get_metrics(3)
+        # Only the first metric has data, in the second window only
+        connector = _StubTSDBConnector(
+            points={metrics[0].full_name: [self.START + timedelta(days=1, hours=6)]}
+        )
+        chunks = list(
+            connector.read_metrics_data_stream(
+                endpoint_id="ep-id",
+                start=self.START,
+                end=self.START + timedelta(days=3) - timedelta(milliseconds=1),
+                metrics=metrics,
+                type="metrics",
+                chunk_interval=timedelta(days=1),
+            )
+        )
+        assert len(connector.read_calls) == 3
+        assert len(chunks) == 2
+        assert [(values.full_name, values.data) for values in chunks[0]] == [
+            (metrics[0].full_name, True)
+        ]
+        assert [(values.full_name, values.data) for values in chunks[1]] == [
+            (metrics[1].full_name, False),
+            (metrics[2].full_name, False),
+        ]
+
+    def test_empty_range(self) -> None:
+        connector = _StubTSDBConnector()
+        assert not list(
+            connector.read_metrics_data_stream(
+                endpoint_id="ep-id",
+                start=self.START,
+                end=self.START - timedelta(hours=1),
+                metrics=_get_metrics(1),
+                type="metrics",
+            )
+        )
+        assert not connector.read_calls
+
+    @pytest.mark.parametrize(
+        "chunk_args",
+        [
+            {"chunk_size": 0},
+            {"chunk_size": -1},
+            {"chunk_interval": timedelta(0)},
+            {"chunk_interval": timedelta(microseconds=10)},
+        ],
+    )
+    def test_invalid_chunks(self, chunk_args: dict[str, Any]) -> None:
+        with pytest.raises(mlrun.errors.MLRunInvalidArgumentError):
+            next(
+                _StubTSDBConnector().read_metrics_data_stream(
+                    endpoint_id="ep-id",
+                    start=self.START,
+                    end=self.START + timedelta(days=1),
+                    metrics=_get_metrics(1),
+                    type="metrics",
+                    **chunk_args,
+                )
+            )
+
+
+def test_batch_write_application_events() -> None:
+    connector = _StubTSDBConnector()
+    events = [{"metric_name": "metric_1"}, {"metric_name": "metric_2"}]
+    connector.batch_write_application_events(
+        events=events, kind=mm_schemas.WriterEventKind.METRIC
+    )
+    assert connector.write_calls == [
+        {"event": event, "kind": mm_schemas.WriterEventKind.METRIC} for event in events
+    ]